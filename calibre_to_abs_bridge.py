@@ -1,57 +1,429 @@
 import os
 import sys
+import re
 import errno
-import xml.etree.ElementTree as ET
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from xml.parsers import expat
 from fuse import FUSE, Operations
 
+# Element names as reported by expat with namespace_separator=' '
+DC_CREATOR_TAG = 'http://purl.org/dc/elements/1.1/ creator'
+DC_TITLE_TAG = 'http://purl.org/dc/elements/1.1/ title'
+OPF_META_TAG = 'http://www.idpf.org/2007/opf meta'
+
+# Anything other than alphanumerics and "-_.() " ('\w' is str.isalnum() plus '_')
+UNSAFE_CHARS_RE = re.compile(r'[^\w\-.() ]')
+# The same replacement for ASCII-only names, as a bytes.translate table
+# (which must have 256 entries, although only the first 128 are used)
+UNSAFE_ASCII_TABLE = bytes(
+    i if chr(i).isalnum() or chr(i) in '-_.() ' else ord('_') for i in range(128)
+) + b'_' * 128
+
+# Attributes returned by getattr. fusepy only reads them, so every directory
+# shares one dict and each file gets its own dict once, at mount time.
+DIR_ATTR = {'st_mode': 0o755 | 0o040000, 'st_nlink': 2}  # Directory
+FILE_MODE = 0o644 | 0o100000  # Regular file
+
+# Seconds the kernel may cache directory entries and attributes
+CACHE_TIMEOUT = 3600
+
+
+class MetadataComplete(Exception):
+    """
+    Raised by the parse_metadata handlers to stop parsing early.
+    """
+
+
+@lru_cache(maxsize=8192)
+def sanitize_name(name):
+    """
+    Sanitize a string to be safe for use in file paths.
+
+    Results are cached, as the same author and series names recur for every
+    book by that author or in that series.
+
+    :param name: The name to sanitize.
+    :return: The sanitized name.
+    """
+    # Replace any character that is not alphanumeric or safe with '_'
+    if name.isascii():
+        # A single table lookup per byte, cheaper than the regex
+        sanitized = name.encode('ascii').translate(UNSAFE_ASCII_TABLE).decode('ascii')
+    else:
+        sanitized = UNSAFE_CHARS_RE.sub('_', name)
+    # Remove extra whitespace
+    sanitized = ' '.join(sanitized.split())
+    return sanitized
+
+
+def parse_metadata(file_path):
+    """
+    Parse metadata from an .opf file.
+
+    :param file_path: Path to the metadata.opf file.
+    :return: A dictionary containing metadata.
+    """
+    found = {}
+    text = []  # Character data of the creator/title element being read
+    capture = None  # Metadata key that text belongs to, if any
+    depth = 0  # Nesting depth of child elements inside the captured element
+    text_open = False  # Whether text is still before the first child element
+
+    def start_element(tag, attrs):
+        nonlocal capture, depth, text_open
+        if capture is not None:
+            # Like Element.text, only the text before the first child counts
+            depth += 1
+            text_open = False
+            return
+        if tag == OPF_META_TAG:
+            name = attrs.get('name')
+            if name == 'calibre:series':
+                found.setdefault('series', attrs.get('content'))
+            elif name == 'calibre:series_index':
+                found.setdefault('series_index', attrs.get('content'))
+        elif tag == DC_CREATOR_TAG and 'author' not in found:
+            capture = 'author'
+            text_open = True
+        elif tag == DC_TITLE_TAG and 'book_title' not in found:
+            capture = 'book_title'
+            text_open = True
+        else:
+            return
+        if len(found) == 4:
+            raise MetadataComplete
+
+    def end_element(tag):
+        nonlocal capture, depth, text_open
+        if capture is None:
+            return
+        if depth:
+            depth -= 1
+            return
+        found[capture] = ''.join(text)
+        text.clear()
+        capture = None
+        text_open = False
+        if len(found) == 4:
+            raise MetadataComplete
+
+    def character_data(data):
+        if text_open:
+            text.append(data)
+
+    def entity_decl(*args):
+        # Calibre never declares entities in its OPF files. Refusing them (so
+        # such a file is treated as unparseable) keeps a crafted file from
+        # expanding into an arbitrarily large document
+        raise expat.ExpatError('entity declarations are not allowed')
+
+    # Stream the document with expat and stop as soon as everything needed
+    # has been seen, so no element tree is ever built
+    parser = expat.ParserCreate(namespace_separator=' ')
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    parser.EntityDeclHandler = entity_decl
+    try:
+        with open(file_path, 'rb') as f:
+            parser.ParseFile(f)
+    except MetadataComplete:
+        pass
+    except expat.ExpatError as e:
+        logging.error(f"Error parsing metadata file {file_path}: {e}")
+        return {
+            'author': 'Unknown Author',
+            'book_title': 'Unknown Title',
+            'series': None,
+            'series_index': None
+        }
+
+    # Extract author
+    author = sanitize_name(found.get('author') or 'Unknown Author')
+
+    # Extract book title
+    book_title = sanitize_name(found.get('book_title') or 'Unknown Title')
+
+    # Extract series information
+    series = found.get('series')
+    if series:
+        series = sanitize_name(series)
+
+    return {
+        'author': author,
+        'book_title': book_title,
+        'series': series,
+        'series_index': found.get('series_index')
+    }
+
+
+def _scan_book_dir(dir_path, rel_prefix, files, dirs):
+    """
+    Recursively list a book directory.
+
+    Uses os.scandir so that the file type comes from the cached directory
+    entry instead of a separate stat() per entry.
+
+    :param dir_path: The directory to list.
+    :param rel_prefix: Path of dir_path relative to the book directory, with
+                       a trailing '/' ('' for the book directory).
+    :param files: List that (relative path, actual path, size) tuples are
+                  added to.
+    :param dirs: List that relative subdirectory paths are added to.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError as e:
+        logging.warning(f"Error listing directory '{dir_path}': {e}")
+        return
+    for entry in entries:
+        rel_path = rel_prefix + entry.name
+        if entry.is_dir():
+            dirs.append(rel_path)
+            # Like os.walk, list symlinked directories but don't descend into them
+            if not entry.is_symlink():
+                _scan_book_dir(entry.path, rel_path + '/', files, dirs)
+        else:
+            # Sizes are recorded once here so getattr needs no stat() call
+            try:
+                size = entry.stat().st_size
+            except OSError as e:
+                logging.warning(f"Error getting size of file '{entry.path}': {e}")
+                continue
+            files.append((rel_path, entry.path, size))
+
+
+def scan_book(metadata_file):
+    """
+    Parse a book's metadata and list the files in its directory.
+
+    This runs in a worker process, so it only returns plain data; the
+    virtual paths are assembled by the caller.
+
+    :param metadata_file: Path to the book's metadata.opf file.
+    :return: A tuple of the metadata dictionary, a list of
+             (relative path, actual path, size) tuples for the files and a list of
+             relative paths for the subdirectories of the book directory, or
+             None if the metadata file could not be read.
+    """
+    try:
+        metadata = parse_metadata(metadata_file)
+    except OSError as e:
+        logging.error(f"Error reading metadata file {metadata_file}: {e}")
+        return None
+    files = []
+    dirs = []
+    # Get the actual book directory (where metadata.opf is located)
+    _scan_book_dir(os.path.dirname(metadata_file), '', files, dirs)
+    return metadata, files, dirs
+
+
+def make_node():
+    """
+    Create a node of the virtual filesystem trie.
+
+    '_children' maps entry names to child nodes and '_attr' holds the
+    attributes returned by getattr. For files, '_file' holds the actual file
+    path; it is None for directories. In lazy mode, author nodes whose books
+    have not been added yet also have a '_pending' list; see
+    BookFS.build_author_structure.
+
+    :return: A new, empty directory node.
+    """
+    return {'_children': {}, '_file': None, '_attr': DIR_ATTR}
+
 
 class BookFS(Operations):
     """
     A FUSE filesystem that organizes books based on their metadata.
     """
-    def __init__(self, root_dir):
+    def __init__(self, root_dir, lazy=False):
         """
         Initialize the filesystem.
 
         :param root_dir: The root directory where the books are stored.
+        :param lazy: Only parse the books of an author when the author's
+                     directory is first used, instead of all of them up front.
         """
         self.root_dir = root_dir
-        self.files = {}  # Mapping from virtual paths to actual file paths
-        self.directories = set()  # Set of directories in the virtual filesystem
-        self.build_file_structure()
+        # Trie of the virtual filesystem keyed by path component; see make_node
+        self.root = make_node()
+        self.parent_nodes = {}  # Mapping from author/series paths to their trie nodes
+        self.pending = {}  # Lazy mode: Calibre author directories not read yet, see build_author_structure
+        if lazy:
+            self.build_author_structure()
+        else:
+            self.build_file_structure()
 
     def build_file_structure(self):
         """
         Build the virtual file structure by parsing metadata from the books.
         """
-        metadata_files = self.find_metadata_files()
-        for metadata_file in metadata_files:
-            metadata = self.parse_metadata(metadata_file)
-            virtual_book_path = self.get_book_path(metadata)
-
-            # Add the directories to the set
-            path_components = virtual_book_path.strip('/').split('/')
-            for i in range(1, len(path_components) + 1):
-                dir_path = os.path.normpath('/' + '/'.join(path_components[:i]))
-                self.directories.add(dir_path)
-
-            # Get the actual book directory (where metadata.opf is located)
-            book_dir = os.path.dirname(metadata_file)
-            # Map all files in the book directory
-            for root, dirs, files in os.walk(book_dir):
-                rel_root = os.path.relpath(root, book_dir)
-                for file in files:
-                    actual_file_path = os.path.join(root, file)
-                    rel_file_path = os.path.join(rel_root, file) if rel_root != '.' else file
-                    virtual_file_path = os.path.normpath(os.path.join('/', virtual_book_path, rel_file_path))
-                    self.files[virtual_file_path] = actual_file_path
-
-                # Add subdirectories to the directories set
-                for dir_name in dirs:
-                    rel_dir_path = os.path.join(rel_root, dir_name) if rel_root != '.' else dir_name
-                    virtual_dir_path = os.path.normpath(os.path.join('/', virtual_book_path, rel_dir_path))
-                    self.directories.add(virtual_dir_path)
+        self.add_books(self.find_metadata_files())
+
+    def add_books(self, metadata_files):
+        """
+        Scan books in a process pool and add them to the virtual filesystem.
+
+        :param metadata_files: Paths to the books' metadata.opf files.
+        """
+        # Parsing and listing each book is independent work, so spread it
+        # over all CPU cores and only merge the results here.
+        with ProcessPoolExecutor() as executor:
+            for book in executor.map(scan_book, metadata_files, chunksize=32):
+                if book is not None:
+                    self.add_book(*book)
+
+    def build_author_structure(self):
+        """
+        Build only the author level of the virtual file structure.
+
+        Calibre keeps the books of each author in one top-level directory, so
+        only the first book found there is parsed to name the author. The
+        directory's other books stay pending in self.pending, and the author's
+        node lists the directory under '_pending', until they are materialized.
+        """
+        try:
+            with os.scandir(self.root_dir) as it:
+                author_dirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+        except OSError as e:
+            logging.error(f"Error listing directory '{self.root_dir}': {e}")
+            return
+        for author_dir in author_dirs:
+            for metadata_file in self._find(author_dir):
+                book = scan_book(metadata_file)
+                if book is not None:
+                    break
+            else:
+                continue
+            self.add_book(*book)
+            self.pending[author_dir] = metadata_file
+            author_node = self.add_path(self.root, [book[0]['author']])
+            author_node.setdefault('_pending', []).append(author_dir)
+
+    def materialize(self, node):
+        """
+        Parse and add the pending books of the Calibre directories that named
+        a node in build_author_structure.
+
+        :param node: The trie node with pending books.
+        """
+        for author_dir in node.pop('_pending'):
+            self.materialize_author_dir(author_dir)
+
+    def materialize_all(self):
+        """
+        Parse and add every pending book.
+
+        A Calibre author directory can hold books whose author differs from
+        its first book's, so only a fully materialized tree can tell that a
+        name does not exist or list a directory completely. This reads most of
+        the library, so it goes through the same process pool as an eager
+        build.
+        """
+        metadata_files = []
+        for author_dir, added_metadata_file in self.pending.items():
+            metadata_files.extend(metadata_file for metadata_file in self._find(author_dir)
+                                  if metadata_file != added_metadata_file)
+        self.pending.clear()
+        self.add_books(metadata_files)
+
+    def materialize_author_dir(self, author_dir):
+        """
+        Parse and add the pending books of a Calibre author directory.
+
+        :param author_dir: The Calibre author directory.
+        """
+        added_metadata_file = self.pending.pop(author_dir, None)
+        if added_metadata_file is None:
+            return
+        for metadata_file in self._find(author_dir):
+            if metadata_file != added_metadata_file:
+                book = scan_book(metadata_file)
+                if book is not None:
+                    self.add_book(*book)
+
+    def add_book(self, metadata, files, dirs):
+        """
+        Add a book to the virtual filesystem.
+
+        :param metadata: A dictionary containing metadata.
+        :param files: (relative path, actual path, size) tuples for the files
+                      of the book directory.
+        :param dirs: Relative paths of the subdirectories of the book directory.
+        """
+        virtual_book_path = self.get_book_path(metadata)
+        # Books of the same author or series share a parent directory, so
+        # only walk down to it the first time it is seen
+        parent_path, book_dir = virtual_book_path.rsplit('/', 1)
+        parent_node = self.parent_nodes.get(parent_path)
+        if parent_node is None:
+            parent_node = self.parent_nodes[parent_path] = self.add_path(self.root, parent_path.split('/'))
+        book_node = self.add_path(parent_node, (book_dir,))
+
+        # Map all files in the book directory
+        for rel_file_path, actual_file_path, size in files:
+            file_node = self.add_path(book_node, rel_file_path.split('/'))
+            file_node['_file'] = actual_file_path
+            file_node['_attr'] = {'st_mode': FILE_MODE, 'st_size': size, 'st_nlink': 1}
+
+        # Add subdirectories of the book directory
+        for rel_dir_path in dirs:
+            self.add_path(book_node, rel_dir_path.split('/'))
+
+    def add_path(self, node, names):
+        """
+        Add a chain of entries to the virtual filesystem, creating any that
+        do not exist yet as directories.
+
+        :param node: The trie node to start from.
+        :param names: The path components below node; empty ones are skipped.
+        :return: The trie node for the last component.
+        """
+        for name in names:
+            if not name or name == '.':
+                continue
+            children = node['_children']
+            child = children.get(name)
+            if child is None:
+                # Names such as 'metadata.opf' and 'cover.jpg' appear in every
+                # book directory, so intern them rather than keeping a copy each
+                child = children[sys.intern(name)] = make_node()
+            node = child
+        return node
+
+    def lookup(self, path, listing=False):
+        """
+        Find the trie node for a virtual path.
+
+        FUSE always passes absolute, normalized paths, so they are split
+        as-is; the empty components around slashes are skipped. Pending nodes
+        on the way are materialized before their children are looked at, and
+        in lazy mode everything is materialized before reporting a missing
+        path or returning a node to be listed.
+
+        :param path: The virtual path.
+        :param listing: The node's children are going to be listed.
+        :return: The trie node, or None if the path does not exist.
+        """
+        node = self.root
+        for name in path.split('/'):
+            if name:
+                if '_pending' in node:
+                    self.materialize(node)
+                node = node['_children'].get(name)
+                if node is None:
+                    if self.pending:
+                        self.materialize_all()
+                        return self.lookup(path)
+                    return None
+        if listing and self.pending:
+            self.materialize_all()
+        return node
 
     def find_metadata_files(self):
         """
@@ -59,60 +431,33 @@ class BookFS(Operations):
 
         :return: A list of paths to metadata.opf files.
         """
-        metadata_files = []
-        for dirpath, dirnames, filenames in os.walk(self.root_dir):
-            if 'metadata.opf' in filenames:
-                metadata_files.append(os.path.join(dirpath, 'metadata.opf'))
-        return metadata_files
+        return list(self._find(self.root_dir))
 
-    def parse_metadata(self, file_path):
+    def _find(self, dir_path):
         """
-        Parse metadata from an .opf file.
+        Recursively find metadata.opf files below a directory.
+
+        Calibre stores each book in a leaf directory, so the search does not
+        descend any further once a directory containing metadata.opf is found.
 
-        :param file_path: Path to the metadata.opf file.
-        :return: A dictionary containing metadata.
+        :param dir_path: The directory to search.
+        :return: An iterator over the paths of the metadata.opf files.
         """
-        ns = {
-            'dc': 'http://purl.org/dc/elements/1.1/',
-            'opf': 'http://www.idpf.org/2007/opf'
-        }
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            # Extract author
-            creator_elem = root.find('.//dc:creator', ns)
-            author = creator_elem.text if creator_elem is not None else 'Unknown Author'
-            author = self.sanitize_name(author)
-
-            # Extract book title
-            title_elem = root.find('.//dc:title', ns)
-            book_title = title_elem.text if title_elem is not None else 'Unknown Title'
-            book_title = self.sanitize_name(book_title)
-
-            # Extract series information
-            series_elem = root.find('.//opf:meta[@name="calibre:series"]', ns)
-            series = series_elem.get('content') if series_elem is not None else None
-            if series:
-                series = self.sanitize_name(series)
-
-            series_index_elem = root.find('.//opf:meta[@name="calibre:series_index"]', ns)
-            series_index = series_index_elem.get('content') if series_index_elem is not None else None
-
-            return {
-                'author': author,
-                'book_title': book_title,
-                'series': series,
-                'series_index': series_index
-            }
-        except ET.ParseError as e:
-            logging.error(f"Error parsing metadata file {file_path}: {e}")
-            return {
-                'author': 'Unknown Author',
-                'book_title': 'Unknown Title',
-                'series': None,
-                'series_index': None
-            }
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logging.warning(f"Error listing directory '{dir_path}': {e}")
+            return
+        subdirs = []
+        for entry in entries:
+            if entry.name == 'metadata.opf':
+                yield entry.path
+                return
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        for subdir in subdirs:
+            yield from self._find(subdir)
 
     def get_book_path(self, metadata):
         """
@@ -133,25 +478,11 @@ class BookFS(Operations):
                     f"Invalid series index '{metadata['series_index']}' for series '{series_dir}'. Using book title instead."
                 )
                 book_dir = metadata['book_title'] or 'Unknown Book'
-            return os.path.join(author_dir, series_dir, book_dir)
+            return f"{author_dir}/{series_dir}/{book_dir}"
         else:
             # Single book
             book_dir = metadata['book_title'] or 'Unknown Book'
-            return os.path.join(author_dir, book_dir)
-
-    def sanitize_name(self, name):
-        """
-        Sanitize a string to be safe for use in file paths.
-
-        :param name: The name to sanitize.
-        :return: The sanitized name.
-        """
-        # Replace any character that is not alphanumeric or safe with '_'
-        safe_chars = "-_.() "
-        sanitized = ''.join(c if c.isalnum() or c in safe_chars else '_' for c in name)
-        # Remove extra whitespace
-        sanitized = ' '.join(sanitized.strip().split())
-        return sanitized
+            return f"{author_dir}/{book_dir}"
 
     # FUSE methods
     def getattr(self, path, fh=None):
@@ -162,27 +493,11 @@ class BookFS(Operations):
         :param fh: File handle (unused).
         :return: A dictionary of file attributes.
         """
-        path = os.path.normpath(path)
-        if path == '/':
-            # Root directory
-            mode = 0o755 | 0o040000  # Directory
-            return {'st_mode': mode, 'st_nlink': 2}
-        elif path in self.files:
-            # It's a file
-            try:
-                mode = 0o644 | 0o100000  # Regular file
-                size = os.path.getsize(self.files[path])
-                return {'st_mode': mode, 'st_size': size, 'st_nlink': 1}
-            except (OSError, IOError) as e:
-                logging.error(f"Error getting attributes for file '{path}': {e}")
-                raise FileNotFoundError(errno.ENOENT, f"File not found: {path}")
-        elif path in self.directories:
-            # It's a directory
-            mode = 0o755 | 0o040000  # Directory
-            return {'st_mode': mode, 'st_nlink': 2}
-        else:
+        node = self.lookup(path)
+        if node is None:
             logging.error(f"Path not found in getattr: {path}")
             raise FileNotFoundError(errno.ENOENT, f"Path not found: {path}")
+        return node['_attr']
 
     def readdir(self, path, fh):
         """
@@ -193,24 +508,11 @@ class BookFS(Operations):
         :return: A list of directory entries.
         """
         dir_entries = ['.', '..']
-        path = os.path.normpath(path)
-        if path == '.':
-            path = '/'
-
-        # Collect all entries (files and directories) that are immediate children of the current directory
-        entries = set()
-
-        # Add directories
-        for dir_path in self.directories:
-            if os.path.dirname(dir_path) == path:
-                entries.add(os.path.basename(dir_path))
-
-        # Add files
-        for file_path in self.files:
-            if os.path.dirname(file_path) == path:
-                entries.add(os.path.basename(file_path))
-
-        dir_entries.extend(entries)
+        node = self.lookup(path, listing=True)
+        if node is None:
+            logging.error(f"Path not found in readdir: {path}")
+            raise FileNotFoundError(errno.ENOENT, f"Path not found: {path}")
+        dir_entries.extend(node['_children'])
         return dir_entries
 
     def read(self, path, size, offset, fh):
@@ -220,37 +522,34 @@ class BookFS(Operations):
         :param path: The path to the file.
         :param size: The number of bytes to read.
         :param offset: The offset in the file.
-        :param fh: File handle (unused).
+        :param fh: File handle returned by open.
         :return: The data read from the file.
         """
-        path = os.path.normpath(path)
-        if path in self.files:
-            try:
-                with open(self.files[path], 'rb') as f:
-                    f.seek(offset)
-                    return f.read(size)
-            except (OSError, IOError) as e:
-                logging.error(f"Error reading file '{path}': {e}")
-                raise OSError(errno.EIO, f"Read error: {path}")
-        else:
-            logging.error(f"File not found in read: {path}")
-            raise FileNotFoundError(errno.ENOENT, f"File not found: {path}")
+        try:
+            return os.pread(fh, size, offset)
+        except (OSError, IOError) as e:
+            logging.error(f"Error reading file '{path}': {e}")
+            raise OSError(errno.EIO, f"Read error: {path}")
 
     def open(self, path, flags):
         """
         Open a file.
 
+        The descriptor of the actual file is kept open and used as the file
+        handle, so reads don't have to reopen the file each time.
+
         :param path: The path to the file.
         :param flags: Flags indicating access mode.
-        :return: File handle (unused).
+        :return: File handle, closed again by release.
         """
-        path = os.path.normpath(path)
-        if path in self.files:
+        node = self.lookup(path)
+        if node is not None and node['_file'] is not None:
+            # The descriptor outlives this call, so never hand out a writable one
+            if flags & os.O_ACCMODE != os.O_RDONLY:
+                logging.warning(f"Attempt to open file '{path}' for writing denied.")
+                raise OSError(errno.EACCES, 'Permission denied')
             try:
-                # Test if the file can be opened
-                fd = os.open(self.files[path], flags)
-                os.close(fd)
-                return 0
+                return os.open(node['_file'], os.O_RDONLY)
             except (OSError, IOError) as e:
                 logging.error(f"Error opening file '{path}': {e}")
                 raise OSError(errno.EACCES, f"Cannot open file: {path}")
@@ -258,6 +557,18 @@ class BookFS(Operations):
             logging.error(f"File not found in open: {path}")
             raise FileNotFoundError(errno.ENOENT, f"File not found: {path}")
 
+    def release(self, path, fh):
+        """
+        Release an open file.
+
+        :param path: The path to the file.
+        :param fh: File handle returned by open.
+        """
+        try:
+            os.close(fh)
+        except OSError as e:
+            logging.error(f"Error closing file '{path}': {e}")
+
     def create(self, path, mode, fi=None):
         """
         Create a file (not allowed).
@@ -319,15 +630,23 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Mount a FUSE filesystem to organize books based on metadata.')
     parser.add_argument('root_dir', help='Root directory containing the books')
     parser.add_argument('mount_point', help='Mount point for the virtual filesystem')
+    parser.add_argument('--lazy', action='store_true',
+                        help="Parse each author's books when the author's directory is first accessed "
+                             "instead of at mount time")
     args = parser.parse_args()
 
     root_dir = args.root_dir
     mount_point = args.mount_point
 
     FUSE(
-        BookFS(root_dir),
+        BookFS(root_dir, lazy=args.lazy),
         mount_point,
         nothreads=True,
         foreground=True,
-        allow_other=True  # Be cautious with this flag due to security implications
+        allow_other=True,  # Be cautious with this flag due to security implications
+        # fusepy has no READDIRPLUS, so the kernel looks up every listed entry
+        # itself. The directory structure is fixed once mounted, so let it cache
+        # those entries and their attributes instead of asking again every time
+        entry_timeout=CACHE_TIMEOUT,
+        attr_timeout=CACHE_TIMEOUT
     )